@@ -1,49 +1,232 @@
+import csv
+import os
+
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+RESULTS_FILE = 'results.csv'
+CACHE_FILE = 'results.cache.pkl'
+# Bump when the processing below or the cached tuple changes
+CACHE_VERSION = 2
+CHUNK_SIZE = 50_000
+MAX_MARKERS = 2000
+OPTIMAL_ALGORITHMS = ['Dynamic Programming', 'ILP']
+COLUMNS = ['Algorithm', 'Pallets', 'Capacity', 'Profit']
+DTYPES = {'Algorithm': 'category', 'Pallets': 'int32', 'Capacity': 'int32', 'Profit': 'float32'}
+# ParserError and schema errors are ValueErrors
+PARSE_ERRORS = (ValueError,) + ((pa.ArrowInvalid, pa.ArrowKeyError) if pa else ())
+
+# results.csv could not be read or lacks the expected columns
+class ResultsFileError(Exception):
+    pass
+
+def _grow_table(table, keys):
+    # Pad with NaN so every key is a valid index into the table
+    if keys.size and keys.max() >= table.size:
+        table = np.concatenate([table, np.full(keys.max() + 1 - table.size, np.nan)])
+    return table
+
+def _group_max(keys, values, table):
+    # Scatter-max values into a table indexed by key
+    table = _grow_table(table, keys)
+    np.fmax.at(table, keys, values)
+    return table
+
+def _accuracy_stats(codes, categories, accuracy):
+    # Rows arrive sorted by algorithm, so each one is a contiguous run
+    columns = ['mean', 'min', 'max']
+    if not codes.size:
+        return pd.DataFrame(columns=columns, index=pd.Index([], name='Algorithm'))
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    
+    valid = ~np.isnan(accuracy)
+    sums = np.add.reduceat(np.where(valid, accuracy, 0.0), starts)
+    counts = np.add.reduceat(valid.astype(np.intp), starts)
+    mins = np.fmin.reduceat(accuracy, starts)
+    maxs = np.fmax.reduceat(accuracy, starts)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / counts
+    
+    index = pd.Index(categories[codes[starts]], name='Algorithm')
+    return pd.DataFrame(dict(zip(columns, (means, mins, maxs))), index=index)
+
+def _check_columns():
+    # Fail with a clear message instead of a reader-specific error
+    with open(RESULTS_FILE, newline='') as f:
+        header = next(csv.reader(f), [])
+    missing = [column for column in COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"missing columns {', '.join(missing)} "
+                         f"(found {', '.join(header) or 'no header'})")
+
+def _read_results():
+    # Yield results.csv in batches, only the columns we use with narrow dtypes
+    if pacsv is not None:
+        reader = pacsv.open_csv(
+            RESULTS_FILE,
+            read_options=pacsv.ReadOptions(block_size=1 << 20),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=COLUMNS,
+                column_types={'Algorithm': pa.dictionary(pa.int32(), pa.string()),
+                              'Pallets': pa.int32(), 'Capacity': pa.int32(),
+                              'Profit': pa.float32()},
+            ),
+        )
+        for batch in reader:
+            yield batch.to_pandas()
+        return
+    
+    yield from pd.read_csv(
+        RESULTS_FILE,
+        usecols=COLUMNS,
+        dtype=DTYPES,
+        chunksize=CHUNK_SIZE,
+    )
+
+def load_accuracy():
+    # Reuse the processed results while results.csv is unchanged
+    key = (CACHE_VERSION, os.path.getmtime(RESULTS_FILE), os.path.getsize(RESULTS_FILE))
+    try:
+        cached_key, *cached = pd.read_pickle(CACHE_FILE)
+        if cached_key == key and len(cached) == 4:
+            return tuple(cached)
+    except Exception:
+        # Missing, corrupt or written by another pandas version: just recompute
+        pass
+    
+    # Only reading is guarded, so processing bugs still raise normally
+    try:
+        _check_columns()
+        chunks = list(_read_results())
+    except PARSE_ERRORS as e:
+        raise ResultsFileError(f"could not parse {RESULTS_FILE}: {e}") from e
+    
+    # PyArrow yields no batches for a header-only file, pandas one empty chunk
+    if not chunks:
+        chunks = [pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in DTYPES.items()})]
+    
+    # Keep a running max of the optimal profit per pallet count
+    optimal = np.empty(0)
+    for chunk in chunks:
+        mask = chunk['Algorithm'].isin(OPTIMAL_ALGORITHMS).to_numpy()
+        optimal = _group_max(chunk['Pallets'].to_numpy()[mask],
+                             chunk['Profit'].to_numpy()[mask], optimal)
+    
+    # Chunks carry their own categories in file order, so re-encode them
+    # sorted after joining, the same with or without pyarrow
+    algorithms = union_categoricals([chunk['Algorithm'] for chunk in chunks],
+                                    sort_categories=True)
+    df = pd.concat(chunks, ignore_index=True)
+    df['Algorithm'] = algorithms
+    
+    # Sort once so every algorithm is contiguous and ordered by pallets
+    df = df.sort_values(['Algorithm', 'Pallets'], kind='mergesort', ignore_index=True)
+    
+    # Look up the optimal profit for each row by its pallet count
+    pallets = df['Pallets'].to_numpy()
+    optimal = _grow_table(optimal, pallets)
+    optimal = optimal[pallets]
+    
+    # Calculate accuracy percentages, kept as arrays aligned with df rows
+    profit = df['Profit'].to_numpy()
+    accuracy = np.empty_like(optimal)
+    np.divide(profit, optimal, out=accuracy)
+    accuracy *= 100.0
+    
+    # Summary statistics
+    accuracy_stats = _accuracy_stats(df['Algorithm'].cat.codes.to_numpy(),
+                                     df['Algorithm'].cat.categories, accuracy)
+    
+    try:
+        pd.to_pickle((key, df, optimal, accuracy, accuracy_stats), CACHE_FILE)
+    except OSError:
+        # Read-only directory or full disk: the cache is only an optimisation
+        pass
+    return df, optimal, accuracy, accuracy_stats
 
 def compare_accuracy():
     try:
-        # Read CSV without header names since file has headers
-        df = pd.read_csv('results.csv')
-        
-        # Group by Pallets and Algorithm to handle duplicates
-        optimal = df[df['Algorithm'].isin(['Dynamic Programming', 'ILP'])]
-        optimal = optimal.groupby('Pallets')['Profit'].max().reset_index()
-        
-        # Merge optimal profits back to original dataframe
-        df = pd.merge(df, optimal, on='Pallets', suffixes=('', '_optimal'))
-        
-        # Calculate accuracy percentages
-        df['Accuracy'] = (df['Profit'] / df['Profit_optimal']) * 100
-        
-        # Summary statistics
-        accuracy_stats = df.groupby('Algorithm')['Accuracy'].agg(['mean', 'min', 'max'])
-        print("\nAccuracy Comparison (% of Optimal):")
-        print(accuracy_stats.round(2))
-        
-        # Visualize
-        plt.figure(figsize=(12, 6))
-        for algo in df['Algorithm'].unique():
-            if algo not in ['Dynamic Programming', 'ILP']:
-                subset = df[df['Algorithm'] == algo]
-                plt.plot(subset['Pallets'], subset['Accuracy'], 'o-', label=algo)
-        
-        plt.axhline(y=100, color='r', linestyle='--', label='Optimal')
+        df, optimal, accuracy, accuracy_stats = load_accuracy()
+    except FileNotFoundError:
+        print(f"Error: {RESULTS_FILE} not found. Run the C++ program first.")
+        return
+    except ResultsFileError as e:
+        print(f"Error: {e}")
+        return
+    
+    print("\nAccuracy Comparison (% of Optimal):")
+    print(accuracy_stats.to_string(float_format=lambda v: f'{v:.2f}'))
+    
+    # Row positions of each algorithm, computed once and reused below
+    by_algo = df.groupby('Algorithm', sort=False, observed=True).indices
+    pallets = df['Pallets'].to_numpy()
+    
+    # Visualize (Agg backend, we only write a PNG)
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+    
+    # Simplify long paths and only mark a subset of points on big series,
+    # without changing rcParams for the rest of the process
+    render_params = {
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10_000,
+    }
+    
+    # One collection for all lines and one scatter for all markers
+    algos = [algo for algo in by_algo if algo not in OPTIMAL_ALGORITHMS]
+    cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    colors = [cycle[i % len(cycle)] for i in range(len(algos))]
+    lines = []
+    marked = []
+    marker_colors = []
+    for algo, color in zip(algos, colors):
+        rows = by_algo[algo]
+        lines.append(np.column_stack((pallets[rows], accuracy[rows])))
+        if rows.size > MAX_MARKERS:
+            rows = rows[np.linspace(0, rows.size - 1, MAX_MARKERS).astype(int)]
+        marked.append(rows)
+        marker_colors += [color] * rows.size
+    
+    with plt.rc_context(render_params):
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.add_collection(LineCollection(lines, colors=colors))
+        if marked:
+            marked = np.concatenate(marked)
+            ax.scatter(pallets[marked], accuracy[marked], c=marker_colors, s=36, zorder=2)
+        ax.autoscale_view()
+    
+        handles = [Line2D([], [], color=color, marker='o', label=algo)
+                   for algo, color in zip(algos, colors)]
+        handles.append(ax.axhline(y=100, color='r', linestyle='--', label='Optimal'))
+    
         plt.xlabel('Number of Pallets')
         plt.ylabel('Accuracy (% of Optimal)')
         plt.title('Algorithm Accuracy Comparison')
-        plt.legend()
+        plt.legend(handles=handles)
         plt.grid()
-        plt.savefig('accuracy_comparison.png', dpi=300, bbox_inches='tight')
-        print("\nSaved accuracy_comparison.png")
-        
-        # Show worst-case greedy performance
-        worst_greedy = df[df['Algorithm'] == 'Greedy'].nsmallest(1, 'Accuracy')
-        print("\nWorst Greedy Performance:")
-        print(worst_greedy[['Pallets', 'Capacity', 'Profit', 'Profit_optimal', 'Accuracy']])
-        
-    except Exception as e:
-        print(f"Error: {str(e)}")
+        plt.savefig('accuracy_comparison.png', dpi=150, bbox_inches='tight')
+        plt.close(fig)
+    print("\nSaved accuracy_comparison.png")
+    
+    # Show worst-case greedy performance
+    greedy = by_algo.get('Greedy', np.empty(0, dtype=np.intp))
+    greedy = greedy[~np.isnan(accuracy[greedy])]
+    worst = greedy[[np.argmin(accuracy[greedy])]] if greedy.size else greedy
+    worst_greedy = df.iloc[worst][['Pallets', 'Capacity', 'Profit']].assign(
+        Profit_optimal=optimal[worst], Accuracy=accuracy[worst])
+    print("\nWorst Greedy Performance:")
+    print(worst_greedy)
 
 if __name__ == "__main__":
     compare_accuracy()
\ No newline at end of file
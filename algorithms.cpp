@@ -152,7 +152,8 @@ void runDynamicProgramming(const vector<Pallet>& pallets, int capacity) {
 
 void runDynamicProgramming1D(const vector<Pallet>& pallets, int capacity) {
     int n = pallets.size();
-    vector<DPCell> dp(capacity + 1, {0, 0, {}});
+    static vector<DPCell> dp; //reused across runs so the menu loop does not reallocate the table
+    dp.assign(capacity + 1, {0, 0, {}});
 
     for (int i = 0; i < n; ++i) {
         int w = pallets[i].weight;
@@ -9,16 +9,27 @@ except ImportError as e:
 def analyze_results():
     try:
        
-        df = pd.read_csv('results.csv')
+        # Stream the file, keeping only running sums and counts per algorithm and pallet count
+        sample = None
+        totals = None
+        for chunk in pd.read_csv('results.csv', dtype={'Pallets': 'int32', 'Time(ms)': 'float32'},
+                                 chunksize=100_000):
+            if sample is None:
+                sample = chunk.head(10)
+            part = chunk.groupby(['Algorithm', 'Pallets'])['Time(ms)'].agg(['sum', 'count'])
+            totals = part if totals is None else totals.add(part, fill_value=0)
         
         print("\nData Sample:")
-        print(df)  
+        print(sample)  
+        
+        # One column of mean times per algorithm, indexed by pallet count
+        times = (totals['sum'] / totals['count']).unstack('Algorithm')
         
         # Time comparison plot
         plt.figure(figsize=(12, 6))
-        for algo in df['Algorithm'].unique():
-            subset = df[df['Algorithm'] == algo]
-            plt.plot(subset['Pallets'], subset['Time(ms)'], 'o-', label=algo)
+        for algo, series in times.items():
+            series = series.dropna()
+            plt.plot(series.index, series.values, 'o-', label=algo)
         plt.xlabel('Number of Pallets')
         plt.ylabel('Execution Time (ms)')
         plt.yscale('log')
@@ -1,73 +1,314 @@
 import sys
 import csv
-import pulp
+from bisect import bisect_right
+from collections import namedtuple
+from functools import partial
+import numpy as np
 
 def read_truck_data(filename):
+    # Columns are Capacity, Pallets; only the first data row is used
     with open(filename, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            capacity = int(row['Capacity'])
-            pallets_count = int(row['Pallets'])
-            return capacity, pallets_count
-    raise ValueError("Truck data file is empty or malformed")
+        reader = csv.reader(csvfile)
+        next(reader, None)
+        row = next(reader, None)
+    if not row or len(row) < 2:
+        raise ValueError("Truck data file is empty or malformed")
+    return int(row[0]), int(row[1])
+
+# Pallet columns kept as parallel int64 arrays, sorted by id
+Pallets = namedtuple('Pallets', 'ids weights profits')
+
+def sort_by_id(pallets):
+    # Files are normally already in id order, so only reorder when they are not
+    if np.all(pallets.ids[1:] >= pallets.ids[:-1]):
+        return pallets
+    order = np.argsort(pallets.ids, kind='stable')
+    return Pallets(*(column[order] for column in pallets))
 
 def read_pallet_data(filename):
-    pallets = []
-    with open(filename, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            pallet_id = int(row['Pallet'])
-            weight = int(row['Weight'])
-            profit = int(row['Profit'])
-            pallets.append({'id': pallet_id, 'weight': weight, 'profit': profit})
-    return pallets
-
-def solve_knapsack(pallets, capacity):
-    
-    n = len(pallets)
-    B = n + 1 
+    # Columns are Pallet, Weight, Profit
+    with open(filename, buffering=1 << 20) as palletfile:
+        return sort_by_id(Pallets(*np.loadtxt(palletfile, delimiter=',', skiprows=1, dtype=np.int64,
+                                              usecols=(0, 1, 2), ndmin=2, unpack=True)))
+
+def tie_break_scores(pallets):
+    # Fewer pallets first, then smaller ids: one pallet costs more than any id sum
+    return int(pallets.ids.sum()) + 1 + pallets.ids
+
+def lex_scores(pallets):
+    # Profit first, then fewer pallets, then smaller ids, packed into one integer per pallet.
+    # The tie-break summed over all pallets stays below one unit of profit
+    ids, profits = pallets.ids, pallets.profits
+    profit_unit = (len(ids) + 1) * (int(ids.sum()) + 1)
+    if int(profits.clip(min=0).sum()) * profit_unit > np.iinfo(np.int64).max:
+        # Python ints don't overflow, at the cost of speed
+        profits = profits.astype(object)
+    return profits * profit_unit - tie_break_scores(pallets)
+
+SOLVERS = {
+    # gapRel=0: the tie-break objective must be solved exactly, not to 0.01%
+    'cbc': lambda pulp: pulp.PULP_CBC_CMD(msg=False, keepFiles=False, warmStart=True, gapRel=0),
+    'highs': lambda pulp: pulp.HiGHS(msg=False, gapRel=0),
+}
+
+def make_solver(solver=None):
+    import pulp
+
+    # HiGHS is called in-process through highspy, CBC is a new process per solve
+    if solver is None:
+        solver = 'highs' if SOLVERS['highs'](pulp).available() else 'cbc'
+    if isinstance(solver, str):
+        return SOLVERS[solver](pulp)
+    return solver
+
+def solve_knapsack(pallets, capacity, solver=None):
+    # Imported here so the DP and branch-and-bound paths don't pay for pulp
+    import pulp
+
+    # PuLP expects plain Python numbers as coefficients
+    ids, weights, profits = (column.tolist() for column in pallets)
+
+    # Identical pallets are interchangeable and smaller ids win ties, so each
+    # (weight, profit) group becomes one integer count taken in id order
+    groups = {}
+    for i, key in enumerate(zip(weights, profits)):
+        groups.setdefault(key, []).append(i)
 
     prob = pulp.LpProblem("Knapsack_Lexico", pulp.LpMaximize)
-    x = {p['id']: pulp.LpVariable(f"x_{p['id']}", cat='Binary') for p in pallets}
+    y = [pulp.LpVariable(f"y_{g}", 0, len(members), cat='Integer')
+         for g, members in enumerate(groups.values())]
+
+    prob += pulp.LpAffineExpression([(var, w) for var, (w, _) in zip(y, groups)]) <= capacity
 
-    prob += (
-        pulp.lpSum(p['profit'] * (B**2) * x[p['id']] for p in pallets)
-        - pulp.lpSum(B * x[p['id']] for p in pallets)
-        - pulp.lpSum(p['id'] * x[p['id']] for p in pallets)
-    )
+    # Greedy by profit/weight gives the solver a feasible starting incumbent;
+    # the stable sort takes identical pallets in id order, as the model does.
+    # Its first misfit also gives the LP-relaxation bound on profit
+    left = capacity
+    greedy_profit = 0
+    bound = None
+    taken = dict.fromkeys(groups, 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = pallets.profits / pallets.weights
+    for i in np.argsort(-ratios, kind='stable').tolist():
+        if profits[i] <= 0:
+            continue
+        if weights[i] <= left:
+            taken[weights[i], profits[i]] += 1
+            left -= weights[i]
+            greedy_profit += profits[i]
+        elif bound is None:
+            bound = greedy_profit + profits[i] * left // weights[i]
+    for var, count in zip(y, taken.values()):
+        var.setInitialValue(count)
 
-    prob += pulp.lpSum(p['weight'] * x[p['id']] for p in pallets) <= capacity
+    # The id sum of the first k pallets of a group is convex in k, so it is
+    # the max of the lines through consecutive prefix sums
+    id_sums = []
+    for g, members in enumerate(groups.values()):
+        id_sum = pulp.LpVariable(f"ids_{g}", 0)
+        prefix = 0
+        for k, i in enumerate(members):
+            prob += id_sum >= prefix + ids[i] * (y[g] - k)
+            prefix += ids[i]
+        id_sums.append(id_sum)
 
-    prob.solve()
+    # Most profit first, then pin it and break ties with fewer pallets and
+    # smaller ids in one objective, weighted as in tie_break_scores. The
+    # second stage starts from the first stage's solution, which stays feasible.
+    pallet_cost = sum(ids) + 1
+    profit = pulp.LpAffineExpression([(var, p) for var, (_, p) in zip(y, groups)])
+    stages = [
+        (pulp.LpMaximize, profit),
+        (pulp.LpMinimize, pulp.LpAffineExpression([(var, pallet_cost) for var in y] +
+                                                  [(var, 1) for var in id_sums])),
+    ]
+    # A greedy fill that reaches the bound already has the most profit
+    if bound is None or greedy_profit == bound:
+        prob += profit >= greedy_profit
+        stages = stages[1:]
+    solver = make_solver(solver)
+    for sense, objective in stages:
+        prob.sense = sense
+        prob.setObjective(objective)
+        prob.solve(solver)
+        if prob.status != pulp.LpStatusOptimal:
+            break
+        best = round(pulp.value(objective) or 0)
+        prob += objective >= best if sense == pulp.LpMaximize else objective <= best
 
-    selected = [p['id'] for p in pallets if pulp.value(x[p['id']]) > 0.5]
-    total_profit = sum(p['profit'] for p in pallets if p['id'] in selected)
-    total_weight = sum(p['weight'] for p in pallets if p['id'] in selected)
+    # varValue is None for variables the solver never assigned
+    chosen = np.zeros(len(ids), dtype=bool)
+    for var, members in zip(y, groups.values()):
+        chosen[members[:round(var.varValue or 0)]] = True
     status = pulp.LpStatus[prob.status]
 
     return {
-        'selected_pallets': sorted(selected),
-        'total_profit': total_profit,
-        'total_weight': total_weight,
+        'selected_pallets': pallets.ids[chosen].tolist(),
+        'total_profit': int(pallets.profits[chosen].sum()),
+        'total_weight': int(pallets.weights[chosen].sum()),
         'status': status
     }
 
-if _name_ == "_main_":
-    if len(sys.argv) < 3:
-        print("Usage: python python.py TP5.csv P5.csv")
+def solve_knapsack_dp(pallets, capacity):
+
+    ids, weights, profits = pallets
+    n = len(ids)
+
+    # For each weight limit c, the best (profit, pallet count, id sum) using at most
+    # c weight: most profit, then fewest pallets, then smallest ids.
+    # keep[i, c] records whether item i was taken
+    best_profit = np.zeros(capacity + 1, dtype=np.int64)
+    best_count = np.zeros(capacity + 1, dtype=np.int64)
+    best_ids = np.zeros(capacity + 1, dtype=np.int64)
+    keep = np.zeros((n, capacity + 1), dtype=bool)
+    for i in range(n):
+        w = weights[i]
+        if w > capacity:
+            continue
+        profit = best_profit[:capacity + 1 - w] + profits[i]
+        count = best_count[:capacity + 1 - w] + 1
+        id_sum = best_ids[:capacity + 1 - w] + ids[i]
+        old_profit, old_count, old_ids = best_profit[w:], best_count[w:], best_ids[w:]
+        take = (profit > old_profit) | ((profit == old_profit) &
+                                       ((count < old_count) | ((count == old_count) & (id_sum < old_ids))))
+        best_profit[w:] = np.where(take, profit, old_profit)
+        best_count[w:] = np.where(take, count, old_count)
+        best_ids[w:] = np.where(take, id_sum, old_ids)
+        keep[i, w:] = take
+
+    chosen = []
+    c = capacity
+    for i in range(n - 1, -1, -1):
+        if keep[i, c]:
+            chosen.append(i)
+            c -= weights[i]
+    chosen.reverse()
+
+    return {
+        'selected_pallets': ids[chosen].tolist(),
+        'total_profit': int(profits[chosen].sum()),
+        'total_weight': int(weights[chosen].sum()),
+        'status': 'Optimal'
+    }
+
+def feasible_sums(weights, cap):
+    # Bit c is set when some subset of weights adds up to exactly c (c <= cap)
+    reach = 1
+    mask = (1 << (cap + 1)) - 1
+    for w in weights:
+        reach = (reach | (reach << w)) & mask
+    return reach
+
+# Largest items x capacity product for which per-suffix bitsets are kept
+MAX_REACH_BITS = 1 << 26
+
+def solve_knapsack_bb(pallets, capacity):
+
+    ids, weights, profits = pallets
+
+    # Items worth taking under the composite score, best score/weight ratio first
+    scores = lex_scores(pallets)
+    order = np.flatnonzero(scores > 0)
+    with np.errstate(divide='ignore'):
+        order = order[np.argsort(-scores[order] / weights[order], kind='stable')]
+    values = scores[order].tolist()
+    item_weights = weights[order].tolist()
+    m = len(order)
+
+    prefix_w = [0]
+    prefix_v = [0]
+    for v, w in zip(values, item_weights):
+        prefix_w.append(prefix_w[-1] + w)
+        prefix_v.append(prefix_v[-1] + v)
+
+    # reach[i] has bit c set when items i..m-1 can fill exactly c, so a node can
+    # shrink its capacity to the largest weight it can actually reach
+    reach = None
+    if m * (capacity + 1) <= MAX_REACH_BITS:
+        mask = (1 << (capacity + 1)) - 1
+        reach = [1] * (m + 1)
+        for i in range(m - 1, -1, -1):
+            reach[i] = (reach[i + 1] | (reach[i + 1] << item_weights[i])) & mask
+    elif capacity <= MAX_REACH_BITS:
+        capacity = feasible_sums(item_weights, capacity).bit_length() - 1
+
+    def bound(i, cap):
+        if reach is not None:
+            cap = (reach[i] & ((1 << (cap + 1)) - 1)).bit_length() - 1
+        # LP relaxation: fill greedily from item i, then a fraction of the first misfit
+        k = bisect_right(prefix_w, prefix_w[i] + cap, i) - 1
+        extra = prefix_v[k] - prefix_v[i]
+        if k < m:
+            extra += (cap - (prefix_w[k] - prefix_w[i])) * values[k] // item_weights[k]
+        return extra
+
+    # Depth-first, taking before skipping; chosen items are a linked list of (index, rest)
+    best = 0
+    best_chosen = None
+    seen = {}
+    stack = [(0, capacity, 0, None)]
+    while stack:
+        i, cap, value, chosen = stack.pop()
+        if value > best:
+            best, best_chosen = value, chosen
+        if i == m or value + bound(i, cap) <= best:
+            continue
+        # A previous visit to the same subproblem with at least this value dominates
+        if seen.get((i, cap), -1) >= value:
+            continue
+        seen[(i, cap)] = value
+
+        stack.append((i + 1, cap, value, chosen))
+        if item_weights[i] <= cap:
+            stack.append((i + 1, cap - item_weights[i], value + values[i], (i, chosen)))
+
+    selected = np.zeros(len(ids), dtype=bool)
+    while best_chosen is not None:
+        i, best_chosen = best_chosen
+        selected[order[i]] = True
+
+    return {
+        'selected_pallets': ids[selected].tolist(),
+        'total_profit': int(profits[selected].sum()),
+        'total_weight': int(weights[selected].sum()),
+        'status': 'Optimal'
+    }
+
+ILP_METHODS = {
+    'ilp': solve_knapsack,
+    'ilp-cbc': partial(solve_knapsack, solver='cbc'),
+    'ilp-highs': partial(solve_knapsack, solver='highs'),
+}
+
+METHODS = {
+    **ILP_METHODS,
+    'dp': solve_knapsack_dp,
+    'bb': solve_knapsack_bb,
+}
+
+def solve(truck_file, pallet_file, method='ilp', **options):
+    capacity, pallets_count = read_truck_data(truck_file)
+    pallets = read_pallet_data(pallet_file)
+    if pallets_count != len(pallets.ids):
+        print(f"Warning: Truck file says {pallets_count} pallets "
+              f"but pallet data file has {len(pallets.ids)} entries")
+
+    # Solver options only apply to the ILP, so a shared solver can be passed to any method
+    if method not in ILP_METHODS:
+        options = {}
+    return METHODS[method](pallets, capacity, **options)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or (len(sys.argv) > 3 and sys.argv[3] not in METHODS):
+        print(f"Usage: python python.py TP5.csv P5.csv [{'|'.join(METHODS)}]")
         sys.exit(1)
 
     truck_file = sys.argv[1]
     pallet_file = sys.argv[2]
+    method = sys.argv[3] if len(sys.argv) > 3 else 'ilp'
 
     try:
-        capacity, pallets_count = read_truck_data(truck_file)
-        pallets = read_pallet_data(pallet_file)
-        if pallets_count != len(pallets):
-            print(f"Warning: Truck file says {pallets_count} pallets "
-                  f"but pallet data file has {len(pallets)} entries")
-
-        result = solve_knapsack(pallets, capacity)
+        result = solve(truck_file, pallet_file, method)
 
         print("Status:", result['status'])
         print("Total Profit:", result['total_profit'])
@@ -0,0 +1,36 @@
+import pytest
+
+import accuracy
+
+READERS = ['pyarrow', 'pandas']
+
+
+@pytest.fixture(params=READERS)
+def results_dir(request, tmp_path, monkeypatch):
+    if request.param == 'pyarrow':
+        if accuracy.pacsv is None:
+            pytest.skip('pyarrow not installed')
+    else:
+        monkeypatch.setattr(accuracy, 'pacsv', None)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_header_only_results_give_an_empty_report(results_dir, capsys):
+    (results_dir / accuracy.RESULTS_FILE).write_text("Algorithm,Pallets,Capacity,Profit\n")
+
+    df, optimal, accuracy_values, accuracy_stats = accuracy.load_accuracy()
+    assert df.empty and optimal.size == 0 and accuracy_values.size == 0
+    assert accuracy_stats.empty
+
+    accuracy.compare_accuracy()
+    assert 'Error' not in capsys.readouterr().out
+
+
+def test_algorithms_are_sorted_whatever_the_reader(results_dir):
+    (results_dir / accuracy.RESULTS_FILE).write_text(
+        "Algorithm,Pallets,Capacity,Profit\n"
+        "ILP,5,10,8\nGreedy,5,10,6\nDynamic Programming,5,10,8\n")
+
+    accuracy_stats = accuracy.load_accuracy()[3]
+    assert list(accuracy_stats.index) == ['Dynamic Programming', 'Greedy', 'ILP']
@@ -0,0 +1,72 @@
+import pytest
+
+import python
+
+
+def write_instance(tmp_path, capacity, pallets):
+    truck_file = tmp_path / 'TP.csv'
+    pallet_file = tmp_path / 'P.csv'
+    truck_file.write_text(f"Capacity,Pallets\n{capacity},{len(pallets)}\n")
+    pallet_file.write_text("Pallet,Weight,Profit\n" +
+                           "".join(f"{pid},{weight},{profit}\n" for pid, weight, profit in pallets))
+    return str(truck_file), str(pallet_file)
+
+
+def require_method(method):
+    if method.startswith('ilp'):
+        pulp = pytest.importorskip('pulp')
+        backend = method.partition('-')[2]
+        if backend and not python.SOLVERS[backend](pulp).available():
+            pytest.skip(f'{backend} solver not available')
+
+
+def solve(tmp_path, capacity, pallets, method, **options):
+    require_method(method)
+    return python.solve(*write_instance(tmp_path, capacity, pallets), method, **options)
+
+
+@pytest.mark.parametrize('method', list(python.METHODS))
+def test_profit_beats_fewer_pallets(tmp_path, method):
+    # One heavy pallet worth 9, or nine light ones worth 10 together
+    pallets = [(1, 10, 9), (2, 1, 2)] + [(pid, 1, 1) for pid in range(3, 11)]
+    result = solve(tmp_path, 10, pallets, method)
+
+    assert result['total_profit'] == 10
+    assert result['selected_pallets'] == list(range(2, 11))
+
+
+@pytest.mark.parametrize('method', list(python.METHODS))
+def test_ties_prefer_fewer_pallets_then_smaller_ids(tmp_path, method):
+    pallets = [(1, 1, 1), (2, 1, 1), (3, 2, 2), (4, 2, 2)]
+    result = solve(tmp_path, 2, pallets, method)
+
+    assert result['total_profit'] == 2
+    assert result['selected_pallets'] == [3]
+
+
+@pytest.mark.parametrize('method', list(python.METHODS))
+def test_shared_solver_is_accepted_by_every_method(tmp_path, method):
+    pytest.importorskip('pulp')
+    pallets = [(1, 1, 1), (2, 1, 1), (3, 2, 2), (4, 2, 2)]
+    result = solve(tmp_path, 2, pallets, method, solver=python.make_solver())
+
+    assert result['selected_pallets'] == [3]
+
+
+@pytest.mark.parametrize('method', ['dp', 'bb', 'ilp'])
+def test_unsorted_pallet_file_gives_ids_in_order(tmp_path, method):
+    # Pallets 3 and 1 are identical, so the tie goes to the smaller id
+    pallets = [(3, 1, 1), (1, 1, 1), (2, 2, 5)]
+    result = solve(tmp_path, 3, pallets, method)
+
+    assert result['total_profit'] == 6
+    assert result['selected_pallets'] == [1, 2]
+
+
+def test_read_pallet_data_sorts_by_id(tmp_path):
+    _, pallet_file = write_instance(tmp_path, 3, [(3, 30, 300), (1, 10, 100), (2, 20, 200)])
+    pallets = python.read_pallet_data(pallet_file)
+
+    assert pallets.ids.tolist() == [1, 2, 3]
+    assert pallets.weights.tolist() == [10, 20, 30]
+    assert pallets.profits.tolist() == [100, 200, 300]